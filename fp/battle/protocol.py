@@ -42,6 +42,23 @@ ABILITIES_REVEALED_ON_SWITCH_IN = [
     "snowwarning",
 ]
 
+# chat and room presence lines never affect the battle state, so there is no
+# reason to hold onto them until the next request is processed
+NON_BATTLE_ACTIONS = {
+    "c",
+    "c:",
+    "chat",
+    "j",
+    "J",
+    "join",
+    "l",
+    "L",
+    "leave",
+    "n",
+    "N",
+    "name",
+}
+
 SIDE_CONDITION_DEFAULT_DURATION = {
     constants.REFLECT: 5,
     constants.LIGHT_SCREEN: 5,
@@ -2264,6 +2281,59 @@ def noinit(battle, split_msg):
         logger.info("Renamed battle to {}".format(battle.battle_tag))
 
 
+# built once rather than for every line that is processed
+BATTLE_MODIFIERS_LOOKUP = {
+    "switch": switch,
+    "faint": faint,
+    "-fail": fail,
+    "drag": drag,
+    "-heal": heal_or_damage,
+    "-damage": heal_or_damage,
+    "-sethp": sethp,
+    "move": move,
+    "-setboost": setboost,
+    "-boost": boost,
+    "-unboost": unboost,
+    "-status": status,
+    "-activate": activate,
+    "-anim": anim,
+    "-prepare": prepare,
+    "-start": start_volatile_status,
+    "-singlemove": start_volatile_status,
+    "-end": end_volatile_status,
+    "-curestatus": curestatus,
+    "-cureteam": cureteam,
+    "-weather": weather,
+    "-fieldstart": fieldstart,
+    "-fieldend": fieldend,
+    "-sidestart": sidestart,
+    "-sideend": sideend,
+    "-swapsideconditions": swapsideconditions,
+    "-item": set_item,
+    "-enditem": remove_item,
+    "-immune": immune,
+    "-ability": update_ability,
+    "detailschange": form_change,
+    "replace": illusion_end,
+    "-formechange": form_change,
+    "-transform": transform,
+    "-mega": mega,
+    "-terastallize": terastallize,
+    "-zpower": zpower,
+    "-clearnegativeboost": clearnegativeboost,
+    "-clearboost": clearboost,
+    "-clearallboost": clearallboost,
+    "-singleturn": singleturn,
+    "-mustrecharge": mustrecharge,
+    "upkeep": upkeep,
+    "cant": cant,
+    "inactive": inactive,
+    "inactiveoff": inactiveoff,
+    "turn": turn,
+    "noinit": noinit,
+}
+
+
 def update_battle(battle: Battle, msg: str):
     msg_lines = msg.split("\n")
     for line in msg_lines:
@@ -2276,7 +2346,7 @@ def update_battle(battle: Battle, msg: str):
             request(battle, split_msg)
             process_battle_updates(battle)
             return not battle.wait
-        else:
+        elif action not in NON_BATTLE_ACTIONS:
             battle.msg_list.append(line)
 
     return False
@@ -2292,58 +2362,7 @@ def process_battle_updates(battle: Battle):
 
         action = split_msg[1].strip()
 
-        battle_modifiers_lookup = {
-            "switch": switch,
-            "faint": faint,
-            "-fail": fail,
-            "drag": drag,
-            "-heal": heal_or_damage,
-            "-damage": heal_or_damage,
-            "-sethp": sethp,
-            "move": move,
-            "-setboost": setboost,
-            "-boost": boost,
-            "-unboost": unboost,
-            "-status": status,
-            "-activate": activate,
-            "-anim": anim,
-            "-prepare": prepare,
-            "-start": start_volatile_status,
-            "-singlemove": start_volatile_status,
-            "-end": end_volatile_status,
-            "-curestatus": curestatus,
-            "-cureteam": cureteam,
-            "-weather": weather,
-            "-fieldstart": fieldstart,
-            "-fieldend": fieldend,
-            "-sidestart": sidestart,
-            "-sideend": sideend,
-            "-swapsideconditions": swapsideconditions,
-            "-item": set_item,
-            "-enditem": remove_item,
-            "-immune": immune,
-            "-ability": update_ability,
-            "detailschange": form_change,
-            "replace": illusion_end,
-            "-formechange": form_change,
-            "-transform": transform,
-            "-mega": mega,
-            "-terastallize": terastallize,
-            "-zpower": zpower,
-            "-clearnegativeboost": clearnegativeboost,
-            "-clearboost": clearboost,
-            "-clearallboost": clearallboost,
-            "-singleturn": singleturn,
-            "-mustrecharge": mustrecharge,
-            "upkeep": upkeep,
-            "cant": cant,
-            "inactive": inactive,
-            "inactiveoff": inactiveoff,
-            "turn": turn,
-            "noinit": noinit,
-        }
-
-        function_to_call = battle_modifiers_lookup.get(action)
+        function_to_call = BATTLE_MODIFIERS_LOOKUP.get(action)
         if function_to_call is not None:
             function_to_call(battle, split_msg)
 
@@ -768,8 +768,9 @@ class Pokemon:
         return False
 
     def get_move(self, move_name: str):
+        normalized_move_name = normalize_name(move_name)
         for m in self.moves:
-            if m.name == normalize_name(move_name):
+            if m.name == normalized_move_name:
                 return m
             elif m.name.startswith(constants.HIDDEN_POWER) and move_name.startswith(
                 constants.HIDDEN_POWER
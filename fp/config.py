@@ -12,7 +12,7 @@ from fp.format_spec import FormatSpec
 class CustomFormatter(logging.Formatter):
     def format(self, record):
         lvl = "{}".format(record.levelname)
-        return "{} {}".format(lvl.ljust(8), record.msg)
+        return "{} {}".format(lvl.ljust(8), record.getMessage())
 
 
 class CustomRotatingFileHandler(RotatingFileHandler):
@@ -1,8 +1,5 @@
 import os
 import json
-import logging
-
-logger = logging.getLogger(__name__)
 
 PWD = os.path.dirname(os.path.abspath(__file__))
 
@@ -35,6 +35,8 @@ class RandomBattleTeamDatasets(FullSetDatasets):
         self.raw_pkmn_sets = {}
         self.pkmn_sets = {}
         self.pkmn_mode = "uninitialized"
+        self._pkmn_sets_items = []
+        self._pkmn_sets_items_source = None
 
     def _load_raw_sets(self, format_spec: FormatSpec):
         self.raw_pkmn_sets = get_randbats_sets_file(format_spec.base_name)
@@ -138,6 +140,14 @@ class RandomBattleTeamDatasets(FullSetDatasets):
 
         return ret
 
+    def pkmn_sets_items(self) -> list[tuple[str, list[PredictedPokemonSet]]]:
+        # unrevealed pokemon are sampled from this list many times per search
+        # so only rebuild it when `pkmn_sets` is replaced (i.e. re-initialized)
+        if self._pkmn_sets_items_source is not self.pkmn_sets:
+            self._pkmn_sets_items = list(self.pkmn_sets.items())
+            self._pkmn_sets_items_source = self.pkmn_sets
+        return self._pkmn_sets_items
+
     def get_all_possible_moves(self, pkmn: Pokemon):
         if not self.pkmn_sets:
             logger.warning("Called `get_all_possible_moves` when pkmn_sets was empty")
@@ -1,6 +1,6 @@
+import hashlib
 import json
 import logging
-from copy import deepcopy
 
 from fp.config import FoulPlayConfig, init_logging, BotModes
 
@@ -16,10 +16,18 @@ from fp.data.mods.apply_mods import apply_mods
 logger = logging.getLogger(__name__)
 
 
-def check_dictionaries_are_unmodified(original_pokedex, original_move_json):
+def data_digest(data) -> bytes:
+    # key-sorted JSON depends only on the values, matching a plain `==` comparison
+    return hashlib.blake2b(json.dumps(data, sort_keys=True).encode()).digest()
+
+
+def check_dictionaries_are_unmodified(
+    original_pokedex_digest, original_move_json_digest
+):
     # The bot should not modify the data dictionaries
     # This is a "just-in-case" check to make sure and will stop the bot if it mutates either of them
-    if original_move_json != all_move_json:
+    # digests are compared so that a second copy of each dictionary isn't kept in memory
+    if original_move_json_digest != data_digest(all_move_json):
         logger.critical(
             "Move JSON changed!\nDumping modified version to `modified_moves.json`"
         )
@@ -29,7 +37,7 @@ def check_dictionaries_are_unmodified(original_pokedex, original_move_json):
     else:
         logger.debug("Move JSON unmodified!")
 
-    if original_pokedex != pokedex:
+    if original_pokedex_digest != data_digest(pokedex):
         logger.critical(
             "Pokedex JSON changed!\nDumping modified version to `modified_pokedex.json`"
         )
@@ -45,8 +53,8 @@ async def run_foul_play():
     init_logging(FoulPlayConfig.log_level, FoulPlayConfig.log_to_file)
     apply_mods(FoulPlayConfig.format_spec)
 
-    original_pokedex = deepcopy(pokedex)
-    original_move_json = deepcopy(all_move_json)
+    original_pokedex_digest = data_digest(pokedex)
+    original_move_json_digest = data_digest(all_move_json)
 
     ps_websocket_client = await PSWebsocketClient.create(
         FoulPlayConfig.username, FoulPlayConfig.password, FoulPlayConfig.websocket_uri
@@ -99,13 +107,15 @@ async def run_foul_play():
         )
         if winner == FoulPlayConfig.username:
             wins += 1
-            logger.info("Won with team: {}".format(team_file_name))
+            logger.info("Won with team: %s", team_file_name)
         else:
             losses += 1
-            logger.info("Lost with team: {}".format(team_file_name))
+            logger.info("Lost with team: %s", team_file_name)
 
-        logger.info("W: {}\tL: {}".format(wins, losses))
-        check_dictionaries_are_unmodified(original_pokedex, original_move_json)
+        logger.info("W: %s\tL: %s", wins, losses)
+        check_dictionaries_are_unmodified(
+            original_pokedex_digest, original_move_json_digest
+        )
 
         battles_run += 1
         if battles_run >= FoulPlayConfig.run_count:
@@ -15,6 +15,12 @@ from fp.websocket_client import PSWebsocketClient
 
 logger = logging.getLogger(__name__)
 
+# a search is already parallelized internally and only one runs at a time,
+# so a single long-lived thread is reused instead of a new pool per move
+SEARCH_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="search"
+)
+
 
 class BattleMode:
     name: str
@@ -157,8 +163,9 @@ def format_decision(battle, decision):
     # Formats a decision for communication with Pokemon-Showdown
     # If the move can be used as a Z-Move, it will be
 
-    if decision.startswith(constants.SWITCH_STRING + " "):
-        switch_pokemon = decision.split("switch ")[-1]
+    switch_prefix = constants.SWITCH_STRING + " "
+    if decision.startswith(switch_prefix):
+        switch_pokemon = decision[len(switch_prefix) :]
         for pkmn in battle.user.reserve:
             if pkmn.name == switch_pokemon:
                 message = "/switch {}".format(pkmn.index)
@@ -169,10 +176,10 @@ def format_decision(battle, decision):
         tera = False
         mega = False
         if decision.endswith("-tera"):
-            decision = decision.replace("-tera", "")
+            decision = decision.removesuffix("-tera")
             tera = True
         elif decision.endswith("-mega"):
-            decision = decision.replace("-mega", "")
+            decision = decision.removesuffix("-mega")
             mega = True
         message = "/choose move {}".format(decision)
 
@@ -196,17 +203,40 @@ def format_decision(battle, decision):
     return [message, str(battle.rqid)]
 
 
+def only_available_switch(battle):
+    # a forced switch with a single pokemon left to bring in has exactly one
+    # legal option, so there is nothing to search for.
+    # revival blessing is a forced switch that targets fainted pokemon instead
+    if not battle.force_switch or battle.user.active.reviving:
+        return None
+
+    alive_reserves = [p for p in battle.user.reserve if p.is_alive()]
+    if len(alive_reserves) != 1:
+        return None
+
+    return "{} {}".format(constants.SWITCH_STRING, alive_reserves[0].name)
+
+
 async def async_pick_move(battle):
     battle_copy = deepcopy(battle)
     if not battle_copy.team_preview:
         battle_copy.user.update_from_request_json(battle_copy.request_json)
 
-    loop = asyncio.get_event_loop()
-    with concurrent.futures.ThreadPoolExecutor() as pool:
-        best_move = await loop.run_in_executor(pool, find_best_move, battle_copy)
+    best_move = only_available_switch(battle_copy)
+    if best_move is not None:
+        logger.info("Only one option available: {}".format(best_move))
+    else:
+        loop = asyncio.get_running_loop()
+        best_move = await loop.run_in_executor(
+            SEARCH_EXECUTOR, find_best_move, battle_copy
+        )
+    # a decision carries at most one of these suffixes
+    move_name = best_move
+    if best_move.endswith(("-tera", "-mega")):
+        move_name = best_move.removesuffix("-tera").removesuffix("-mega")
     battle.user.last_selected_move = LastUsedMove(
         battle.user.active.name,
-        best_move.removesuffix("-tera").removesuffix("-mega"),
+        move_name,
         battle.turn,
     )
     return format_decision(battle_copy, best_move)
@@ -1,5 +1,4 @@
 import asyncio
-import concurrent.futures
 import logging
 from copy import deepcopy
 
@@ -7,6 +6,7 @@ from fp.battle.state import LastUsedMove, Pokemon, Battle
 from fp.config import FoulPlayConfig
 from fp.constants import BattleType
 from fp.data.sets import SmogonSets
+from fp.modes.base import SEARCH_EXECUTOR
 from fp.modes.standard_battle import StandardBattleMode
 from fp.search import standard_battles
 from fp.search.bss import bss_team_preview, prepare_post_team_preview_bss_battles
@@ -48,11 +48,10 @@ class BSSMode(StandardBattleMode):
         battle_copy.opponent.active = Pokemon.get_dummy()
         battle_copy.team_preview = True
 
-        loop = asyncio.get_event_loop()
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            (best_move, opponent_affinities) = await loop.run_in_executor(
-                pool, bss_team_preview, battle_copy
-            )
+        loop = asyncio.get_running_loop()
+        (best_move, opponent_affinities) = await loop.run_in_executor(
+            SEARCH_EXECUTOR, bss_team_preview, battle_copy
+        )
 
         battle.opponent_team_preview_affinities = opponent_affinities
 
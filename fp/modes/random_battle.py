@@ -36,20 +36,20 @@ class RandomBattleMode(BattleMode):
         )
         self.datasets.initialize(battle.format_spec)
 
-        while True:
-            if constants.START_STRING in msg:
-                battle.started = True
-
-                # hold onto some messages to apply after we get the request JSON
-                # omit the bot's switch-in message because we won't need that
-                # parsing the request JSON will set the bot's active pkmn
-                battle.msg_list = [
-                    m
-                    for m in msg.split(constants.START_STRING)[1].strip().split("\n")
-                    if not (m.startswith("|switch|{}".format(battle.user.name)))
-                ]
-                break
+        while constants.START_STRING not in msg:
             msg = await ps_websocket_client.receive_message()
+        battle.started = True
+
+        # hold onto some messages to apply after we get the request JSON
+        # omit the bot's switch-in message because we won't need that
+        # parsing the request JSON will set the bot's active pkmn
+        _, _, battle_msgs = msg.partition(constants.START_STRING)
+        switch_prefix = "|switch|{}".format(battle.user.name)
+        battle.msg_list = [
+            m
+            for m in battle_msgs.strip().split("\n")
+            if not m.startswith(switch_prefix)
+        ]
 
         await get_first_request_json(ps_websocket_client, battle)
 
@@ -32,14 +32,12 @@ async def start_battle(ps_websocket_client, pokemon_battle_type, team_dict):
 
 async def pokemon_battle(ps_websocket_client, pokemon_battle_type, team_dict):
     battle = await start_battle(ps_websocket_client, pokemon_battle_type, team_dict)
+    receive_message = ps_websocket_client.receive_message
     while True:
-        msg = await ps_websocket_client.receive_message()
+        msg = await receive_message()
         if battle_is_finished(battle.battle_tag, msg):
-            winner = (
-                msg.split(constants.WIN_STRING)[-1].split("\n")[0].strip()
-                if constants.WIN_STRING in msg
-                else None
-            )
+            _, win_string, winner_msg = msg.rpartition(constants.WIN_STRING)
+            winner = winner_msg.split("\n", 1)[0].strip() if win_string else None
             logger.info("Winner: {}".format(winner))
             await ps_websocket_client.send_message(battle.battle_tag, ["gg"])
             if (
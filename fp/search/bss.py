@@ -71,8 +71,8 @@ def prepare_post_team_preview_bss_battles(
     return sampled_battles
 
 
+# `battle` is modified in place; callers pass a copy of the live battle
 def bss_team_preview(battle: Battle) -> (str, dict[str, float]):
-    battle = deepcopy(battle)
     if battle.team_preview:
         battle.user.active = battle.user.reserve.pop(0)
         battle.opponent.active = battle.opponent.reserve.pop(0)
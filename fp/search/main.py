@@ -1,5 +1,6 @@
 import logging
 import random
+from collections import defaultdict
 from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 
@@ -14,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 
 def select_move_from_mcts_results(mcts_results: list[(MctsResult, float, int)]) -> str:
-    final_policy = {}
+    final_policy = defaultdict(float)
     for mcts_result, sample_chance, index in mcts_results:
         this_policy = max(mcts_result.side_one, key=lambda x: x.visits)
         logger.info(
@@ -27,9 +28,9 @@ def select_move_from_mcts_results(mcts_results: list[(MctsResult, float, int)])
             )
         )
         for s1_option in mcts_result.side_one:
-            final_policy[s1_option.move_choice] = final_policy.get(
-                s1_option.move_choice, 0
-            ) + (sample_chance * (s1_option.visits / mcts_result.total_visits))
+            final_policy[s1_option.move_choice] += sample_chance * (
+                s1_option.visits / mcts_result.total_visits
+            )
 
     final_policy = sorted(final_policy.items(), key=lambda x: x[1], reverse=True)
 
@@ -40,7 +41,7 @@ def select_move_from_mcts_results(mcts_results: list[(MctsResult, float, int)])
     for i, policy in enumerate(final_policy):
         logger.info(f"\t{round(policy[1] * 100, 3)}%: {policy[0]}")
 
-    choice = random.choices(final_policy, weights=[p[1] for p in final_policy])[0]
+    choice = random.choices(final_policy, weights=[w for _, w in final_policy])[0]
     return choice[0]
 
 
@@ -56,8 +57,10 @@ def get_result_from_mcts(
 
 
 def find_best_move(battle: Battle) -> str:
-    battle = deepcopy(battle)
     if battle.team_preview:
+        # callers still format the decision against the battle they passed in,
+        # so the leads must not be popped out of its reserves
+        battle = deepcopy(battle)
         battle.user.active = battle.user.reserve.pop(0)
         battle.opponent.active = battle.opponent.reserve.pop(0)
 
@@ -71,6 +74,10 @@ def find_best_move(battle: Battle) -> str:
     with ProcessPoolExecutor(max_workers=FoulPlayConfig.parallelism) as executor:
         futures = []
         for index, (b, chance) in enumerate(battles):
+            # serialize here rather than in the worker: a Battle is not picklable
+            # (lambda defaultdicts, and the mode holds the entire sets dataset).
+            # each job is submitted as soon as its state is ready so workers
+            # start searching while the remaining states are serialized
             fut = executor.submit(
                 get_result_from_mcts,
                 battle_to_poke_engine_state(b).to_string(),
@@ -1,5 +1,6 @@
 import logging
 import random
+from collections import Counter
 from copy import deepcopy
 
 from fp.data import pokedex
@@ -14,6 +15,8 @@ from fp.battle.helpers import (
 
 logger = logging.getLogger(__name__)
 
+_ALL_TYPES = tuple(POKEMON_TYPE_INDICES.keys())
+
 
 def get_all_remaining_sets_for_revealed_pkmn(battle: Battle) -> dict:
     revealed_pkmn = []
@@ -24,15 +27,13 @@ def get_all_remaining_sets_for_revealed_pkmn(battle: Battle) -> dict:
 
     ret = {}
     for pkmn in revealed_pkmn:
-        sets = battle.mode.get_all_remaining_sets(pkmn)
-        random.shuffle(sets)
-        ret[pkmn.name] = sets
+        ret[pkmn.name] = battle.mode.get_all_remaining_sets(pkmn)
 
     return ret
 
 
 def prepare_random_battles(battle: Battle, num_battles: int) -> list[(Battle, float)]:
-    revealed_pkmn_sets = get_all_remaining_sets_for_revealed_pkmn(deepcopy(battle))
+    revealed_pkmn_sets = get_all_remaining_sets_for_revealed_pkmn(battle)
 
     sampled_battles = []
     for index in range(num_battles):
@@ -47,7 +48,7 @@ def prepare_random_battles(battle: Battle, num_battles: int) -> list[(Battle, fl
             )[0]
             populate_pkmn_from_set(active, pkmn_full_set)
 
-        for pkmn in filter(lambda x: x.is_alive(), battle_copy.opponent.reserve):
+        for pkmn in (p for p in battle_copy.opponent.reserve if p.is_alive()):
             if not revealed_pkmn_sets[pkmn.name]:
                 continue
             pkmn_full_set = random.choices(
@@ -75,35 +76,33 @@ def sample_randombattle_pokemon(existing_pokemon: list[Pokemon], datasets) -> Po
 
         return False
 
-    ok = False
     existing_pokemon_names = {pkmn.name for pkmn in existing_pokemon}
     has_mega = any(is_mega(p) for p in existing_pokemon)
+    pkmn_sets_items = datasets.pkmn_sets_items()
+
+    # the last slot is overwritten by each candidate so the team legality
+    # checks don't need a fresh list per attempt
+    team = existing_pokemon + [None]
 
     sample_count = 0
-    while not ok:
+    while True:
         sample_count += 1
-        ok = True
-        pkmn_name, pkmn_sets = random.choice(list(datasets.pkmn_sets.items()))
+        pkmn_name, pkmn_sets = random.choice(pkmn_sets_items)
         pkmn_full_set = random.choice(pkmn_sets)
         pkmn = Pokemon(pkmn_name, pkmn_full_set.pkmn_set.level)
         if pkmn_name in existing_pokemon_names:
-            ok = False
-        if sample_count < 10 and is_mega(pkmn) and has_mega:
-            ok = False
-        if sample_count < 10 and _more_than_3_pokemon_weak_to_a_given_typing(
-            existing_pokemon + [pkmn]
-        ):
-            ok = False
-        if sample_count < 10 and _more_than_1_species(existing_pokemon + [pkmn]):
-            ok = False
-        if sample_count < 10 and _more_than_2_pokemon_of_any_type(
-            existing_pokemon + [pkmn]
-        ):
-            ok = False
-        if sample_count < 10 and _more_than_1_pokemon_with_4x_weakness(
-            existing_pokemon + [pkmn]
-        ):
-            ok = False
+            continue
+        if sample_count < 10:
+            team[-1] = pkmn
+            if (
+                (is_mega(pkmn) and has_mega)
+                or _more_than_3_pokemon_weak_to_a_given_typing(team)
+                or _more_than_1_species(team)
+                or _more_than_2_pokemon_of_any_type(team)
+                or _more_than_1_pokemon_with_4x_weakness(team)
+            ):
+                continue
+        break
 
     populate_pkmn_from_set(pkmn, pkmn_full_set)
     return pkmn
@@ -125,7 +124,7 @@ def _more_than_1_species(team: list[Pokemon]) -> bool:
 def _more_than_3_pokemon_weak_to_a_given_typing(team: list[Pokemon]) -> bool:
     num_pkmn_weak_to_typing = {}
     for pkmn in team:
-        for t in POKEMON_TYPE_INDICES.keys():
+        for t in _ALL_TYPES:
             if is_super_effective(t, pkmn.types):
                 num_pkmn_weak_to_typing[t] = num_pkmn_weak_to_typing.get(t, 0) + 1
 
@@ -136,48 +135,38 @@ def _more_than_3_pokemon_weak_to_a_given_typing(team: list[Pokemon]) -> bool:
 
 
 def _more_than_2_pokemon_of_any_type(team: list[Pokemon]) -> bool:
-    num_of_each_type = {}
+    num_of_each_type = Counter()
     for pkmn in team:
-        num_of_each_type[pkmn.types[0]] = num_of_each_type.get(pkmn.types[0], 0) + 1
-        if len(pkmn.types) > 1:
-            num_of_each_type[pkmn.types[1]] = num_of_each_type.get(pkmn.types[1], 0) + 1
-
-    if any(x > 2 for x in num_of_each_type.values()):
-        return True
+        num_of_each_type.update(pkmn.types[:2])
 
-    return False
+    return bool(num_of_each_type) and num_of_each_type.most_common(1)[0][1] > 2
 
 
 def _more_than_1_pokemon_with_4x_weakness(team: list[Pokemon]) -> bool:
-    num_of_each_4x_weakness = {}
+    num_of_each_4x_weakness = Counter()
     for pkmn in team:
-        for t in POKEMON_TYPE_INDICES.keys():
-            if type_effectiveness_modifier(t, pkmn.types) == 4:
-                num_of_each_4x_weakness[t] = num_of_each_4x_weakness.get(t, 0) + 1
+        num_of_each_4x_weakness.update(
+            t for t in _ALL_TYPES if type_effectiveness_modifier(t, pkmn.types) == 4
+        )
 
-    if any(x > 1 for x in num_of_each_4x_weakness.values()):
-        return True
-
-    return False
+    return (
+        bool(num_of_each_4x_weakness)
+        and num_of_each_4x_weakness.most_common(1)[0][1] > 1
+    )
 
 
 # take a Battle and fill in the unrevealed pkmn for the opponent
 def populate_randombattle_unrevealed_pkmn(battle: Battle):
-    num_revealed_pkmn = 0
-    existing_pkmn = []
-    for pkmn in battle.opponent.reserve:
-        existing_pkmn.append(pkmn)
-        num_revealed_pkmn += 1
+    existing_pkmn = list(battle.opponent.reserve)
     if battle.opponent.active is not None:
         existing_pkmn.append(battle.opponent.active)
-        num_revealed_pkmn += 1
 
-    if num_revealed_pkmn == 6:
+    num_unrevealed_pkmn = 6 - len(existing_pkmn)
+    if num_unrevealed_pkmn <= 0:
         return
 
-    logger.info("Sampling {} unrevealed pokemon".format(6 - num_revealed_pkmn))
-    while num_revealed_pkmn < 6:
+    logger.info("Sampling {} unrevealed pokemon".format(num_unrevealed_pkmn))
+    for _ in range(num_unrevealed_pkmn):
         pkmn = sample_randombattle_pokemon(existing_pkmn, battle.mode.datasets)
         existing_pkmn.append(pkmn)
         battle.opponent.reserve.append(pkmn)
-        num_revealed_pkmn += 1
@@ -1,5 +1,7 @@
 import random
 import os
+from functools import lru_cache
+
 from .team_converter import export_to_packed, export_to_dict
 
 TEAM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "teams")
@@ -44,11 +46,15 @@ def load_team(name):
     else:
         raise ValueError("Path must be file or dir: {}".format(name))
 
+    team_packed, team_dict = _parse_team_file(file_path)
+    return team_packed, team_dict, os.path.basename(file_path)
+
+
+# the same few team files are loaded before every battle.
+# the returned team dict is shared between callers and must not be modified
+@lru_cache(maxsize=None)
+def _parse_team_file(file_path):
     with open(file_path, "r") as f:
         team_export = f.read()
 
-    return (
-        export_to_packed(team_export),
-        export_to_dict(team_export),
-        os.path.basename(file_path),
-    )
+    return export_to_packed(team_export), export_to_dict(team_export)
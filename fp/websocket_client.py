@@ -2,7 +2,6 @@ import asyncio
 import websockets
 import requests
 import json
-import time
 
 import logging
 
@@ -24,7 +23,7 @@ class PSWebsocketClient:
     username = None
     password = None
     last_message = None
-    last_challenge_time = 0
+    last_team_sent = None
 
     @classmethod
     async def create(cls, username, password, address):
@@ -47,12 +46,13 @@ class PSWebsocketClient:
 
     async def receive_message(self):
         message = await self.websocket.recv()
-        logger.debug("Received message from websocket: {}".format(message))
+        # formatted lazily: most frames are only logged when DEBUG is enabled
+        logger.debug("Received message from websocket: %s", message)
         return message
 
     async def send_message(self, room, message_list):
         message = room + "|" + "|".join(message_list)
-        logger.debug("Sending message to websocket: {}".format(message))
+        logger.debug("Sending message to websocket: %s", message)
         await self.websocket.send(message)
         self.last_message = message
 
@@ -63,8 +63,8 @@ class PSWebsocketClient:
             # Wait for the query response and check the avatar
             # |queryresponse|QUERYTYPE|JSON
             msg = await self.receive_message()
-            msg_split = msg.split("|")
-            if msg_split[1] == "queryresponse":
+            msg_split = msg.split("|", 3)
+            if len(msg_split) == 4 and msg_split[1] == "queryresponse":
                 user_details = json.loads(msg_split[3])
                 if user_details["avatar"] == avatar:
                     logger.info("Avatar set to {}".format(avatar))
@@ -86,14 +86,46 @@ class PSWebsocketClient:
             if split_message[1] == "challstr":
                 return split_message[2], split_message[3]
 
+    async def wait_for_login_confirmation(self, timeout=10):
+        try:
+            await asyncio.wait_for(self._receive_login_confirmation(), timeout)
+        except asyncio.TimeoutError:
+            logger.error(
+                "Login Unsuccessful: no confirmation after {}s".format(timeout)
+            )
+            raise LoginError(
+                "Could not log-in: no confirmation after {}s".format(timeout)
+            )
+
+    async def _receive_login_confirmation(self):
+        while True:
+            # |updateuser| USERNAME|NAMED|AVATAR|SETTINGS
+            # NAMED is 1 once the server has accepted the /trn
+            msg = await self.receive_message()
+            for line in msg.split("\n"):
+                split_line = line.split("|")
+                if len(split_line) < 2:
+                    continue
+                if (
+                    split_line[1] == "updateuser"
+                    and len(split_line) > 3
+                    and split_line[3] == "1"
+                ):
+                    return
+                elif split_line[1] == "nametaken":
+                    logger.error("Login Unsuccessful: {}".format(line))
+                    raise LoginError("Could not log-in: {}".format(line))
+
     async def login(self):
         logger.info("Logging in...")
         client_id, challstr = await self.get_id_and_challstr()
 
         guest_login = self.password is None
 
+        # the login request is blocking; keep it off the event loop
         if guest_login:
-            response = requests.post(
+            response = await asyncio.to_thread(
+                requests.post,
                 self.login_uri,
                 data={
                     "act": "getassertion",
@@ -102,7 +134,8 @@ class PSWebsocketClient:
                 },
             )
         else:
-            response = requests.post(
+            response = await asyncio.to_thread(
+                requests.post,
                 self.login_uri,
                 data={
                     "name": self.username,
@@ -127,19 +160,23 @@ class PSWebsocketClient:
             assertion = response_json.get("assertion")
 
         message = ["/trn " + self.username + ",0," + assertion]
-        logger.info("Successfully logged in")
         await self.send_message("", message)
-        await asyncio.sleep(3)
+        await self.wait_for_login_confirmation()
+        logger.info("Successfully logged in")
         return self.username if guest_login else response_json["curuser"]["userid"]
 
     async def update_team(self, team):
+        # the server keeps the last team for the connection, so re-sending
+        # the same team before every battle is unnecessary
+        if team == self.last_team_sent:
+            return
         await self.send_message("", ["/utm {}".format(team)])
+        self.last_team_sent = team
 
     async def challenge_user(self, user_to_challenge, battle_format):
         logger.info("Challenging {}...".format(user_to_challenge))
         message = ["/challenge {},{}".format(user_to_challenge, battle_format)]
         await self.send_message("", message)
-        self.last_challenge_time = time.time()
 
     async def accept_challenge(self, battle_format, room_name):
         if room_name is not None:
@@ -149,7 +186,7 @@ class PSWebsocketClient:
         username = None
         while username is None:
             msg = await self.receive_message()
-            split_msg = msg.split("|")
+            split_msg = msg.split("|", 8)
             if (
                 len(split_msg) == 9
                 and split_msg[1] == "pm"
@@ -172,9 +209,13 @@ class PSWebsocketClient:
         message = ["/leave {}".format(battle_tag)]
         await self.send_message("", message)
 
+        # the room header is always the whole first line of a frame, so most
+        # unrelated frames are rejected without scanning the whole message.
+        # the newline keeps e.g. battle-gen9ou-12 from matching battle-gen9ou-1
+        room_header = ">{}\n".format(battle_tag)
         while True:
             msg = await self.receive_message()
-            if battle_tag in msg and "deinit" in msg:
+            if msg.startswith(room_header) and "|deinit" in msg:
                 return
 
     async def save_replay(self, battle_tag):
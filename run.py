@@ -4,11 +4,19 @@ import traceback
 
 from fp.main import run_foul_play
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is not available on Windows; fall back to the default event loop
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 if __name__ == "__main__":
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
     try:
-        asyncio.run(run_foul_play())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(run_foul_play())
     except Exception:
         logger.error(traceback.format_exc())
         raise
@@ -7305,6 +7305,18 @@ class TestUpdateBattle:
         assert False is result
         assert True is self.battle.wait
 
+    def test_chat_and_presence_lines_are_not_queued(self):
+        msg = (
+            "|c|+SomeUser|hello\n"
+            "|j| OtherUser\n"
+            "|l| OtherUser\n"
+            "|move|p1a: Caterpie|Tackle|p2a: Pikachu"
+        )
+        result = update_battle(self.battle, msg)
+
+        assert False is result
+        assert ["|move|p1a: Caterpie|Tackle|p2a: Pikachu"] == self.battle.msg_list
+
     def test_lines_without_an_action_are_ignored(self):
         msg = "battle-gen9ou-12345"
         result = update_battle(self.battle, msg)
@@ -0,0 +1,29 @@
+import os
+
+from fp.teams import load_team
+from fp.teams.load_team import TEAM_DIR, _parse_team_file
+
+
+class TestLoadTeam:
+    def test_no_team_name_returns_null_team(self):
+        assert ("null", "", "") == load_team(None)
+
+    def test_loads_a_team_file(self):
+        team_packed, team_dict, team_file_name = load_team("gen8/ou/balance")
+        assert "balance" == team_file_name
+        assert 6 == len(team_dict)
+        assert 6 == len(team_packed.split("]"))
+
+    def test_loading_the_same_file_twice_reuses_the_parsed_team(self):
+        _parse_team_file.cache_clear()
+
+        first = load_team("gen8/ou/balance")
+        second = load_team("gen8/ou/balance")
+
+        assert first[1] is second[1]
+        assert 1 == _parse_team_file.cache_info().misses
+        assert 1 == _parse_team_file.cache_info().hits
+
+    def test_directory_loads_a_team_from_that_directory(self):
+        _, _, team_file_name = load_team("gen8/ou")
+        assert team_file_name in os.listdir(os.path.join(TEAM_DIR, "gen8/ou"))
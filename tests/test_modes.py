@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 
 from copy import deepcopy
@@ -6,7 +7,12 @@ from fp.config import FoulPlayConfig
 from fp.constants import BattleType
 from fp.battle.state import Battle, Pokemon
 from fp.modes import BATTLE_MODES, battle_mode
-from fp.modes.base import BattleMode, format_decision
+from fp.modes.base import (
+    BattleMode,
+    format_decision,
+    handle_team_preview,
+    only_available_switch,
+)
 from fp.modes.battle_factory import (
     BattleFactoryMode,
     extract_battle_factory_tier_from_msg,
@@ -98,6 +104,76 @@ class TestFormatDecision:
         ] == format_decision(self.battle, "thunderbolt-tera")
 
 
+class TestOnlyAvailableSwitch:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        self.battle = Battle(None)
+        self.battle.force_switch = True
+        self.battle.user.active = Pokemon("pikachu", 100)
+        self.battle.user.active.hp = 0
+        self.battle.user.reserve = [Pokemon("weedle", 100), Pokemon("caterpie", 100)]
+
+    def test_one_alive_reserve_is_the_only_option(self):
+        self.battle.user.reserve[1].hp = 0
+        assert "switch weedle" == only_available_switch(self.battle)
+
+    def test_multiple_alive_reserves_need_a_search(self):
+        assert only_available_switch(self.battle) is None
+
+    def test_no_forced_switch_needs_a_search(self):
+        self.battle.force_switch = False
+        self.battle.user.reserve[1].hp = 0
+        assert only_available_switch(self.battle) is None
+
+    def test_revival_blessing_needs_a_search(self):
+        self.battle.user.active.reviving = True
+        self.battle.user.reserve[1].hp = 0
+        assert only_available_switch(self.battle) is None
+
+
+class FakeWebsocketClient:
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, room, message_list):
+        self.sent.append((room, message_list))
+
+
+class TestHandleTeamPreview:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        FoulPlayConfig.parallelism = 1
+        yield
+        del FoulPlayConfig.parallelism
+
+    def test_choosing_the_first_reserve_as_lead(self, monkeypatch):
+        # run the real find_best_move, which pops the leads out of the reserves,
+        # with the sampling and the search itself stubbed out
+        monkeypatch.setattr(
+            "fp.search.main.select_move_from_mcts_results",
+            lambda mcts_results: "switch pikachu",
+        )
+        battle = Battle("battle-gen9ou-1")
+        battle.generation = "gen9"
+        battle.rqid = 1
+        battle.mode = StandardBattleMode()
+        monkeypatch.setattr(battle.mode, "search_params", lambda b: (0, 0))
+        monkeypatch.setattr(battle.mode, "prepare_battles", lambda b, n: [])
+        for index, name in enumerate(
+            ["pikachu", "weedle", "caterpie", "pidgey", "rattata", "spearow"],
+            start=1,
+        ):
+            pkmn = Pokemon(name, 100)
+            pkmn.index = index
+            battle.user.reserve.append(pkmn)
+            battle.opponent.reserve.append(Pokemon(name, 100))
+
+        client = FakeWebsocketClient()
+        asyncio.run(handle_team_preview(battle, client))
+
+        assert [("battle-gen9ou-1", ["/team 123456|1"])] == client.sent
+
+
 class TestBattleIsFinished:
     def test_win_message_for_the_right_battle_tag(self):
         msg = ">battle-gen9ou-123\n|win|SomePlayer\n"
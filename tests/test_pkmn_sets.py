@@ -7,6 +7,7 @@ from fp.data.sets import (
     PredictedPokemonSet,
     PokemonSet,
     PokemonMoveset,
+    RandomBattleTeamDatasets,
 )
 from fp.battle.state import Pokemon, Move
 from fp.format_spec import FormatSpec
@@ -265,3 +266,25 @@ class TestPredictSet:
 
         sets_after_removed_item = team_datasets.get_all_remaining_sets(pkmn)
         assert 0 != len(sets_after_removed_item)
+
+
+class TestRandomBattleTeamDatasets:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        self.datasets = RandomBattleTeamDatasets()
+
+    def test_pkmn_sets_items_is_reused_while_pkmn_sets_is_unchanged(self):
+        self.datasets.pkmn_sets = {"pikachu": [], "growlithe": []}
+
+        items = self.datasets.pkmn_sets_items()
+
+        assert [("pikachu", []), ("growlithe", [])] == items
+        assert items is self.datasets.pkmn_sets_items()
+
+    def test_pkmn_sets_items_is_rebuilt_when_pkmn_sets_is_replaced(self):
+        self.datasets.pkmn_sets = {"pikachu": []}
+        self.datasets.pkmn_sets_items()
+
+        self.datasets.pkmn_sets = {"growlithe": []}
+
+        assert [("growlithe", [])] == self.datasets.pkmn_sets_items()
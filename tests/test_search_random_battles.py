@@ -143,10 +143,7 @@ class TestGetAllRemainingSetsForRevealedPkmn:
         ret = get_all_remaining_sets_for_revealed_pkmn(self.battle)
 
         assert {"pikachu", "growlithe"} == set(ret.keys())
-        # shuffled, so compare without order
-        assert 2 == len(ret["pikachu"])
-        assert self.pikachu_set_1 in ret["pikachu"]
-        assert self.pikachu_set_2 in ret["pikachu"]
+        assert [self.pikachu_set_1, self.pikachu_set_2] == ret["pikachu"]
         assert [self.growlithe_set] == ret["growlithe"]
 
     def test_revealed_move_filters_out_sets_without_that_move(self):
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from fp.websocket_client import LoginError, PSWebsocketClient
+
+
+class FakeWebsocket:
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.sent = []
+
+    async def recv(self):
+        if not self.messages:
+            # behave like a server that never sends anything else
+            await asyncio.Event().wait()
+        return self.messages.pop(0)
+
+    async def send(self, message):
+        self.sent.append(message)
+
+
+def client_with_messages(messages):
+    client = PSWebsocketClient()
+    client.websocket = FakeWebsocket(messages)
+    return client
+
+
+class TestWaitForLoginConfirmation:
+    def test_named_updateuser_confirms_the_login(self):
+        client = client_with_messages(
+            [
+                "|updateuser| Guest 123|0|1|{}",
+                "|formats|...\n|updateuser| foulplay|1|1|{}",
+            ]
+        )
+        asyncio.run(client.wait_for_login_confirmation(timeout=1))
+        assert [] == client.websocket.messages
+
+    def test_nametaken_raises_login_error(self):
+        client = client_with_messages(["|nametaken|foulplay|Someone is using it"])
+        with pytest.raises(LoginError):
+            asyncio.run(client.wait_for_login_confirmation(timeout=1))
+
+    def test_no_confirmation_raises_login_error_after_the_timeout(self):
+        client = client_with_messages(["|updateuser| Guest 123|0|1|{}"])
+        with pytest.raises(LoginError):
+            asyncio.run(client.wait_for_login_confirmation(timeout=0.05))
+
+
+class TestLeaveBattle:
+    def test_waits_for_the_deinit_of_the_battle_being_left(self):
+        client = client_with_messages(
+            [
+                ">battle-gen9ou-12\n|deinit",
+                ">battle-gen9ou-1\n|j| someone",
+                ">battle-gen9ou-1\n|deinit",
+                ">lobby\n|c|someone|hi",
+            ]
+        )
+        asyncio.run(client.leave_battle("battle-gen9ou-1"))
+        assert ["|/leave battle-gen9ou-1"] == client.websocket.sent
+        assert [">lobby\n|c|someone|hi"] == client.websocket.messages